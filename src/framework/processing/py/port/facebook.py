@@ -4,11 +4,12 @@ DDP facebook module
 This module contains functions to handle *.jons files contained within a facebook ddp
 """
 from pathlib import Path
+from typing import IO
 import logging
 import zipfile
-import io
 
 import pandas as pd
+import numpy as np
 
 import port.api.props as props
 import port.unzipddp as unzipddp
@@ -112,10 +113,10 @@ def validate_zip(zfile: Path) -> ValidateInput:
         paths = []
         with zipfile.ZipFile(zfile, "r") as zf:
             for f in zf.namelist():
-                p = Path(f)
-                if p.suffix in (".html", ".json"):
-                    logger.debug("Found: %s in zip", p.name)
-                    paths.append(p.name)
+                if f.endswith((".html", ".json")):
+                    name = f.rpartition("/")[2]
+                    logger.debug("Found: %s in zip", name)
+                    paths.append(name)
 
         validate.set_status_code(0)
         validate.infer_ddp_category(paths)
@@ -129,15 +130,14 @@ def validate_zip(zfile: Path) -> ValidateInput:
 
 
 
-def extract_conversation(b: io.BytesIO) -> list[props.PropsUIPromptConsentFormTable] | list:
+def extract_conversation(fp: IO[bytes]) -> list[props.PropsUIPromptConsentFormTable] | list:
     """
-    Function expects bytes from messages_1.json from a facebook_zip
+    Function expects a binary file object of messages_1.json from a facebook_zip
     """
 
-    d = unzipddp.read_json_from_bytes(b)
+    d = unzipddp.read_json_from_bytes(fp)
 
     df = pd.DataFrame()
-    datapoints = []
     out = []
 
     try:
@@ -147,14 +147,21 @@ def extract_conversation(b: io.BytesIO) -> list[props.PropsUIPromptConsentFormTa
         title_en = f"Conversation between: {', '.join(participants)}"
         title = props.Translatable({"en": title_en, "nl": title_nl})
 
-        for m in d["messages"]:
-            datapoints.append((
-                m.get("sender_name", None),
-                helpers.fix_string_encoding(m.get("content", None)),
-                helpers.epoch_to_iso(m.get("timestamp_ms", None) / 1000)
-            ))
-        df = pd.DataFrame(datapoints, columns=["Sender", "Content", "Time"])
-        df = df.sort_values(by="Time", ascending=False)
+        # Collect columns, timestamps are converted in one go instead of per message
+        messages = d["messages"]
+        senders = np.array([m.get("sender_name", None) for m in messages], dtype=object)
+        contents = np.array([helpers.fix_string_encoding(m.get("content", None)) for m in messages], dtype=object)
+        timestamps = [m.get("timestamp_ms", None) for m in messages]
+        times, seconds = helpers.epoch_ms_to_iso(timestamps)
+
+        # Newest first, timestamps that could not be converted last
+        order = np.argsort(-seconds, kind="stable")
+
+        df = pd.DataFrame({
+            "Sender": pd.Categorical(senders[order]),
+            "Content": contents[order],
+            "Time": times[order],
+        })
 
         out = helpers.create_consent_form_tables(title_nl, title, df)
 
@@ -171,9 +178,13 @@ def extract_conversations(facebook_zip: str) -> list[props.PropsUIPromptConsentF
         with zipfile.ZipFile(facebook_zip, "r") as zf:
             for f in zf.namelist():
                 logger.debug("Contained in zip: %s", f)
-                if Path(f).name == "message_1.json":
-                    conversation_bytes = io.BytesIO(zf.read(f))
-                    out.extend(extract_conversation(conversation_bytes))
+                if f.rpartition("/")[2] == "message_1.json":
+                    # A conversation that cannot be read should not cost the others
+                    try:
+                        with zf.open(f, "r") as fp:
+                            out.extend(extract_conversation(fp))
+                    except Exception as e:
+                        logger.error("Could not extract conversation %s: %s", f, e)
 
     except zipfile.BadZipFile as e:
         logger.error("BadZipFile:  %s", e)
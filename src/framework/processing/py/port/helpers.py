@@ -158,6 +158,47 @@ def epoch_to_iso(epoch_timestamp: str | int) -> str:
     return out
 
 
+# Epoch seconds of datetime.min and datetime.max (UTC), the range epoch_to_iso can convert
+EPOCH_MIN = -62135596800
+EPOCH_MAX = 253402300799
+
+INT64_MIN = np.iinfo(np.int64).min
+INT64_MAX = np.iinfo(np.int64).max
+
+
+def epoch_ms_to_iso(epoch_timestamps_ms: list[int]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Array version of epoch_to_iso for epoch timestamps in milliseconds. Assumes UTC.
+
+    Returns the ISO 8601 strings and the epoch seconds (float) to sort on.
+    Timestamps that cannot be converted keep their raw value (in seconds) like epoch_to_iso,
+    their epoch seconds are NaN
+    """
+    n = len(epoch_timestamps_ms)
+    fits = np.ones(n, dtype=bool)
+    try:
+        ms = np.fromiter(epoch_timestamps_ms, dtype=np.int64, count=n)
+    except OverflowError:
+        # Beyond int64 is out of range anyway, set those timestamps aside
+        fits = np.fromiter((INT64_MIN <= t <= INT64_MAX for t in epoch_timestamps_ms), dtype=bool, count=n)
+        ms = np.fromiter((t if f else 0 for t, f in zip(epoch_timestamps_ms, fits)), dtype=np.int64, count=n)
+
+    # Truncate towards zero like int() in epoch_to_iso, floor division rounds negatives down
+    seconds = ms // 1000
+    seconds += (ms < 0) & (ms % 1000 != 0)
+    converted = fits & (seconds >= EPOCH_MIN) & (seconds <= EPOCH_MAX)
+
+    seconds_dt = np.where(converted, seconds, 0).astype("datetime64[s]")
+    out = np.char.add(np.datetime_as_string(seconds_dt), "+00:00").astype(object)
+
+    if not converted.all():
+        failed = np.flatnonzero(~converted)
+        logger.error("Could not convert %s epoch time timestamp(s)", len(failed))
+        out[failed] = [str(epoch_timestamps_ms[i] / 1000) for i in failed]
+
+    return out, np.where(converted, seconds, np.nan)
+
+
 def convert_datetime_str(datetime_str: list[str] | list[int]) -> pd.DatetimeIndex | None:
     """
     If timestamps are ISO 8601 return those
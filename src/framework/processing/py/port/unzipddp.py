@@ -2,8 +2,7 @@
 Contains functions to deal with zipfiles
 """
 
-from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, IO
 import logging
 import zipfile
 import json
@@ -29,7 +28,7 @@ def extract_file_from_zip(zfile: str, file_to_extract: str) -> io.BytesIO:
 
             for f in zf.namelist():
                 logger.debug("Contained in zip: %s", f)
-                if Path(f).name == file_to_extract:
+                if f.rpartition("/")[2] == file_to_extract:
                     #print('extract_file_from_zip found a message json', f)
 
                     file_to_extract_bytes = io.BytesIO(zf.read(f))
@@ -51,9 +50,7 @@ def extract_file_from_zip(zfile: str, file_to_extract: str) -> io.BytesIO:
 
 
 def _json_reader_bytes(json_bytes: bytes, encoding: str) -> Any:
-    json_bytes_stream = io.BytesIO(json_bytes)
-    stream = io.TextIOWrapper(json_bytes_stream, encoding=encoding)
-    result = json.load(stream)
+    result = json.loads(json_bytes.decode(encoding))
     return result
 
 
@@ -95,9 +92,9 @@ def _read_json(json_input: Any, json_reader: Callable[[Any, str], Any]) -> dict[
     return out
 
 
-def read_json_from_bytes(json_bytes: io.BytesIO) -> dict[Any, Any] | list[Any]:
+def read_json_from_bytes(json_bytes: IO[bytes]) -> dict[Any, Any] | list[Any]:
     """
-    Reads json from io.BytesIO buffer
+    Reads json from io.BytesIO buffer or any other binary file object (such as an opened zip member)
     this function is a wrapper around _read_json
 
     Function returns {} in case of failure
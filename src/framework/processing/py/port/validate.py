@@ -32,6 +32,11 @@ class DDPCategory:
     language: Language
     known_files: list[str]
 
+    known_files_lookup: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.known_files_lookup = frozenset(self.known_files)
+
 
 @dataclass
 class StatusCode:
@@ -66,7 +71,7 @@ class ValidateInput:
         prop_category = {}
         for identifier, category in self.ddp_categories_lookup.items():
             n_files_found = [
-                1 if f in category.known_files else 0 for f in file_list_input
+                1 if f in category.known_files_lookup else 0 for f in file_list_input
             ]
             prop_category[identifier] = sum(n_files_found) / len(category.known_files) * 100
             logger.debug("propertion of ddp categories: %s", prop_category)